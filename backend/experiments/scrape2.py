@@ -108,8 +108,7 @@ class ManifestoScraper:
 
         try:
             # Check if collection exists
-            collections = self.client.collections.list_all()
-            if cop_copertine_collname not in collections:
+            if not self.client.collections.exists(cop_copertine_collname):
                 collection = self.client.collections.create(
                     name=cop_copertine_collname,
                     description=COPERTINE_COLL_CONFIG["description"],
@@ -307,6 +306,8 @@ class ManifestoScraper:
             result = self.collection.query.fetch_objects(
                 filters=Filter.by_property("editionId").equal(date_str),
                 limit=1,
+                return_properties=[],
+                include_vector=False,
             )
             return len(result.objects) > 0
         except Exception:
@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import json
 import logging
 import os
@@ -106,8 +107,7 @@ class ManifestoScraper:
 
         try:
             # Check if collection exists
-            collections = self.client.collections.list_all()
-            if cop_copertine_collname not in collections:
+            if not self.client.collections.exists(cop_copertine_collname):
                 collection = self.client.collections.create(
                     name=cop_copertine_collname,
                     description=COPERTINE_COLL_CONFIG["description"],
@@ -302,15 +302,12 @@ class ManifestoScraper:
     def _delete_existing_edition(self, date_str: str):
         """Delete existing edition from Weaviate if it exists"""
         try:
-            # First find objects with matching editionId
-            result = self.collection.query.fetch_objects(
-                filters=Filter.by_property("editionId").equal(date_str)
+            # Delete by filter server-side in one request
+            result = self.collection.data.delete_many(
+                where=Filter.by_property("editionId").equal(date_str)
             )
-            # Then delete them one by one
-            for obj in result.objects:
-                self.collection.data.delete_by_id(obj.uuid)
-            if result.objects:
-                logger.info("Deleted %d existing editions for date %s", len(result.objects), date_str)
+            if result.successful:
+                logger.info("Deleted %d existing editions for date %s", result.successful, date_str)
         except Exception:
             logger.exception("Failed to delete existing edition in Weaviate for date %s", date_str)
 
@@ -395,7 +392,6 @@ class ManifestoScraper:
                 # Close any open connections
                 self.client.close()
                 # Get event loop
-                import asyncio
                 try:
                     loop = asyncio.get_event_loop()
                 except RuntimeError:
@@ -1,33 +1,44 @@
 """FastAPI endpoint for searching Copertine objects."""
 
+import threading
+import time
 from contextlib import asynccontextmanager
 
 import weaviate.exceptions
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from src.includes.mytypes import Copertina
-from src.includes.utils import init_weaviate_client
+from src.includes.utils import init_weaviate_async_client
 
 
 # Create FastAPI lifespan to handle client cleanup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Initialize on startup
-    app.state.weaviate_client = init_weaviate_client()
+    # Initialize on startup; the async client keeps queries off the event loop
+    app.state.weaviate_client = init_weaviate_async_client()
+    await app.state.weaviate_client.connect()
     yield
     # Cleanup on shutdown
-    app.state.weaviate_client.close()
+    await app.state.weaviate_client.close()
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Error messages as constants
 INVALID_MODE_ERROR = "Invalid mode. Must be 'literal' or 'fuzzy'."
 
-def query_copertine(client, searchstr: str, mode: str) -> list[Copertina]:
+# Search result cache: the UI repeats a small set of queries, and the archive
+# only changes when the daily scraper runs
+SEARCH_CACHE_TTL = 300  # seconds
+SEARCH_CACHE_MAXSIZE = 1024
+_search_cache: dict[tuple[str, str], tuple[float, tuple[Copertina, ...]]] = {}
+_search_cache_lock = threading.Lock()
+
+async def query_copertine(client, searchstr: str, mode: str) -> list[Copertina]:
     """Query the Weaviate database for Copertine objects matching search criteria.
 
     Args:
-        client: Weaviate client instance
+        client: Connected async Weaviate client instance
         search: Search term to match against Copertine objects
         mode: Search mode, either 'literal' or 'fuzzy'
 
@@ -46,24 +57,19 @@ def query_copertine(client, searchstr: str, mode: str) -> list[Copertina]:
 
         if mode == "fuzzy":
             # Fuzzy search using vector similarity
-            response = copcoll.query.near_text(
+            response = await copcoll.query.near_text(
                 query=searchstr,
                 limit=30,
             )
         else:
             # Literal search using BM25
-            response = copcoll.query.bm25(
+            response = await copcoll.query.bm25(
                 query=searchstr,
                 limit=30,
             )
 
-        # Convert response objects to Copertina models
-        copertine = []
-        for obj in response.objects:
-            # Create Copertina object from properties
-            copertina = Copertina(**obj.properties)
-            copertine.append(copertina)
-        return copertine  # noqa: TRY300
+        # Create Copertina objects from properties
+        return [Copertina(**obj.properties) for obj in response.objects]
 
     except weaviate.exceptions.WeaviateQueryError as e:
         error_msg = repr(e) if not str(e) else str(e)
@@ -79,6 +85,28 @@ def query_copertine(client, searchstr: str, mode: str) -> list[Copertina]:
         ) from e
 
 
+async def cached_query_copertine(client, searchstr: str, mode: str) -> list[Copertina]:
+    """Return query_copertine results, reusing answers younger than SEARCH_CACHE_TTL.
+
+    Only successful queries are cached; errors propagate as before.
+    """
+    key = (searchstr, mode)
+    now = time.monotonic()
+    with _search_cache_lock:
+        hit = _search_cache.get(key)
+    if hit and now - hit[0] < SEARCH_CACHE_TTL:
+        return list(hit[1])
+
+    copertine = await query_copertine(client, searchstr, mode)
+    with _search_cache_lock:
+        _search_cache.pop(key, None)
+        if len(_search_cache) >= SEARCH_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _search_cache[next(iter(_search_cache))]
+        _search_cache[key] = (now, tuple(copertine))
+    return copertine
+
+
 @app.get("/api/v1/copertine", response_model=list[Copertina])
 async def get_copertine(
     search: str = Query(..., description="Search term for copertine objects"),
@@ -91,6 +119,6 @@ async def get_copertine(
     dates, images, captions, and kicker text.
     """
     try:
-        return query_copertine(app.state.weaviate_client, search, mode)
+        return await cached_query_copertine(app.state.weaviate_client, search, mode)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -100,9 +100,7 @@ class WeaviateMigrator:
     def _ensure_collection_exists(self, client: weaviate.WeaviateClient, collection_name: str):
         """Ensure the collection exists in the given Weaviate instance."""
         try:
-            collections = client.collections.list_all()
-            
-            if collection_name not in collections:
+            if not client.collections.exists(collection_name):
                 collection = client.collections.create_from_dict(COPERTINE_COLL_CONFIG)
                 self.logger.info(f"Created {collection_name} collection")
                 return collection
@@ -135,7 +133,9 @@ class WeaviateMigrator:
         try:
             existing_objects = self.new_collection.query.fetch_objects(
                 filters=wvc.query.Filter.by_property("editionId").equal(edition_id),
-                limit=1
+                limit=1,
+                return_properties=[],
+                include_vector=False,
             )
             return len(existing_objects.objects) > 0
         except Exception:
@@ -1,6 +1,7 @@
 import logging
 import os
 from datetime import datetime, timezone
+from urllib.parse import urlparse
 
 import weaviate
 from dotenv import load_dotenv
@@ -24,52 +25,46 @@ def setup_logging(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def _is_wcs_url(weaviate_url: str) -> bool:
+    """Tell a Weaviate Cloud URL from a local/self-hosted one."""
+    # WCS URLs typically start with https:// and contain weaviate cloud domains
+    return weaviate_url.startswith("https://") and (".weaviate." in weaviate_url or "weaviate.io" in weaviate_url)
+
+
+def _parse_local_url(weaviate_url: str) -> tuple[str, int]:
+    """Extract host and HTTP port from a local Weaviate URL."""
+    # Accepts full URLs like http://weaviate2025:8090 as well as a bare
+    # hostname like "weaviate2025"
+    parsed = urlparse(weaviate_url if "://" in weaviate_url else f"http://{weaviate_url}")
+    return parsed.hostname or "", parsed.port or 8080
+
+
 def init_weaviate_client() -> weaviate.WeaviateClient:
     """Initialize Weaviate client with error handling."""
     load_dotenv()
     try:
         weaviate_url = os.getenv("COP_WEAVIATE_URL", "")
-        
-        # Determine if this is a local connection (not a WCS URL)
-        # WCS URLs typically start with https:// and contain weaviate cloud domains
-        is_wcs = weaviate_url.startswith("https://") and (".weaviate." in weaviate_url or "weaviate.io" in weaviate_url)
-        
-        if not is_wcs:
-            # This is a local connection
-            if weaviate_url == "localhost":
-                # Simple localhost case
-                client = weaviate.connect_to_local()
-            else:
-                # Parse URL to extract host and port for local connections
-                if "://" in weaviate_url:
-                    # Parse full URL like http://weaviate2025:8090 or http://localhost:8080
-                    protocol, rest = weaviate_url.split("://", 1)
-                    if ":" in rest:
-                        host, port_str = rest.split(":", 1)
-                        port = int(port_str)
-                    else:
-                        host = rest
-                        port = 8080
-                else:
-                    # Just hostname like "weaviate2025"
-                    host = weaviate_url
-                    port = 8080
-                
-                client = weaviate.connect_to_custom(
-                    http_host=host,
-                    http_port=port,
-                    http_secure=False,
-                    grpc_host=host,
-                    grpc_port=50051,
-                    grpc_secure=False,
-                )
-        else:
+
+        if _is_wcs_url(weaviate_url):
             # For remote WCS connections
             weaviate_api_key = os.getenv("COP_WEAVIATE_API_KEY", "")
             client = weaviate.connect_to_wcs(
                 cluster_url=weaviate_url,
                 auth_credentials=weaviate.auth.AuthApiKey(weaviate_api_key),
             )
+        elif weaviate_url == "localhost":
+            # Simple localhost case
+            client = weaviate.connect_to_local()
+        else:
+            host, port = _parse_local_url(weaviate_url)
+            client = weaviate.connect_to_custom(
+                http_host=host,
+                http_port=port,
+                http_secure=False,
+                grpc_host=host,
+                grpc_port=50051,
+                grpc_secure=False,
+            )
     except Exception as e:
         error_message = "Failed to initialize Weaviate client"
         raise WeaviateClientInitializationError(error_message) from e
@@ -77,6 +72,40 @@ def init_weaviate_client() -> weaviate.WeaviateClient:
         return client
 
 
+def init_weaviate_async_client() -> weaviate.WeaviateAsyncClient:
+    """Create an async Weaviate client from the same settings.
+
+    The client is returned unconnected; await its connect() before use.
+    """
+    load_dotenv()
+    try:
+        weaviate_url = os.getenv("COP_WEAVIATE_URL", "")
+
+        if _is_wcs_url(weaviate_url):
+            weaviate_api_key = os.getenv("COP_WEAVIATE_API_KEY", "")
+            client = weaviate.use_async_with_weaviate_cloud(
+                cluster_url=weaviate_url,
+                auth_credentials=weaviate.auth.AuthApiKey(weaviate_api_key),
+            )
+        elif weaviate_url == "localhost":
+            client = weaviate.use_async_with_local()
+        else:
+            host, port = _parse_local_url(weaviate_url)
+            client = weaviate.use_async_with_custom(
+                http_host=host,
+                http_port=port,
+                http_secure=False,
+                grpc_host=host,
+                grpc_port=50051,
+                grpc_secure=False,
+            )
+    except Exception as e:
+        error_message = "Failed to initialize Weaviate async client"
+        raise WeaviateClientInitializationError(error_message) from e
+    else:
+        return client
+
+
 def extract_date_from_filename(filename: str) -> datetime | None:
     """Extract date from filename pattern il_manifesto_del_D_MONTH_YYYY_cover.jpg."""
     try:
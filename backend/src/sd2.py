@@ -1,23 +1,92 @@
 """ Scrape Directus 2 — PostgreSQL backend """
 import argparse
+import atexit
 import logging
-import mimetypes
 import os
+import queue
 import re
 import sys
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    WatchedFileHandler,
+)
 from pathlib import Path
 from typing import Any
 
+import orjson
 import psycopg2
+import psycopg2.extras
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add the project root to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
 # Constants
-HTTP_OK = 200
+MAX_WORKERS = 16
+SPAN_MAX_GAP_DAYS = 7
+UPSERT_BATCH_SIZE = 200
+# Retry dropped connections and transient gateway errors with a short backoff
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+LOG_BUFFER_CAPACITY = 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+DATE_FORMAT = "%Y-%m-%d"
+EDITION_ID_FORMAT = "%d-%m-%Y"
+DAY_START_FORMAT = f"{DATE_FORMAT}T00:00:00"
+DAY_END_FORMAT = f"{DATE_FORMAT}T23:59:59"
+SLUG_SEPARATOR_RE = re.compile(r'[\s\W]+')
+
+# Filters shared by every copertina lookup; the date window is merged in
+COPERTINA_BASE_PARAMS = {
+    # Expand the image relation so the asset filename arrives with the article
+    'fields': 'id,datePublished,referenceHeadline,articleKicker,articleFeaturedImage.id,articleFeaturedImage.image',
+    'filter[syncSource][_eq]': 'wp',
+    'filter[articlePositionCover][_eq]': 1,
+    'sort': '-datePublished',
+    # A whole date range is fetched at once and bucketed per day
+    'limit': -1,
+}
+
+# SQL
+SELECT_EDITIONS_SQL = """
+    SELECT edition_id, caption, kicker, image_filename
+    FROM editions
+    WHERE edition_id = ANY(%s);
+"""
+UPSERT_SQL = """
+    INSERT INTO editions (edition_id, edition_date, caption, kicker, image_filename)
+    VALUES (%s, %s, %s, %s, %s)
+    ON CONFLICT (edition_id) DO UPDATE SET
+        caption = EXCLUDED.caption,
+        kicker = EXCLUDED.kicker,
+        image_filename = EXCLUDED.image_filename,
+        updated_at = now();
+"""
+
+# (edition_id, edition_date, caption, kicker, image_filename)
+EditionRow = tuple[str, date, str, str | None, str]
+
+
+# Extensions for the image types Directus serves; anything else is saved as .jpg
+IMAGE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/webp': '.webp',
+    'image/gif': '.gif',
+}
+
+
+def _guess_extension(content_type: str) -> str:
+    """Map an image content type to a file extension, defaulting to .jpg."""
+    mime_type = content_type.split(';', 1)[0].strip().lower()
+    return IMAGE_EXTENSIONS.get(mime_type, '.jpg')
 
 
 class ScraperError(Exception):
@@ -58,17 +127,41 @@ class DirectusManifestoScraper:
         self._init_db()
         self._init_directus()
         self._setup_images_dir()
+        self.force_download = False
 
     def _setup_logging(self):
-        """Configure logging."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
-            handlers=[
-                logging.FileHandler("scrapedirectus.log"),
-                logging.StreamHandler(),
-            ],
+        """Configure logging.
+
+        Records are queued by a QueueHandler and written out by a background
+        QueueListener, so the scraping code never blocks on file or console I/O.
+        """
+        formatter = logging.Formatter(
+            "%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+        )
+        # Reopens the file if logrotate moves it between cron runs
+        file_handler = WatchedFileHandler("scrapedirectus.log")
+        console_handler = logging.StreamHandler()
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+        # Write the log file in bulk; errors still reach it immediately
+        self._log_buffer = MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
         )
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        # Formatting happens in the listener's handlers; keep the message bare here
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        self._log_listener = QueueListener(log_queue, self._log_buffer, console_handler)
+        self._log_listener.start()
+        # Stopped at exit rather than in cleanup() so that the final messages
+        # logged by main() after the scraper is closed are still written;
+        # atexit runs in reverse order, so the listener drains before the
+        # buffer is flushed to the file
+        atexit.register(self._log_buffer.close)
+        atexit.register(self._log_listener.stop)
+
         # Reduce noise from external libraries
         for lib in ["httpx", "httpcore"]:
             logging.getLogger(lib).setLevel(logging.WARNING)
@@ -98,31 +191,37 @@ class DirectusManifestoScraper:
             self.logger.exception("Failed to connect to PostgreSQL")
             raise
 
-    def _upsert_edition(self, edition_id: str, edition_date: datetime,
-                        caption: str, kicker: str | None, image_filename: str):
-        """Upsert a copertina edition into PostgreSQL."""
-        sql = """
-            INSERT INTO editions (edition_id, edition_date, caption, kicker, image_filename)
-            VALUES (%s, %s, %s, %s, %s)
-            ON CONFLICT (edition_id) DO UPDATE SET
-                caption = EXCLUDED.caption,
-                kicker = EXCLUDED.kicker,
-                image_filename = EXCLUDED.image_filename,
-                updated_at = now();
+    def _fetch_existing_editions(self, edition_ids: list[str]) -> dict[str, tuple[str, str | None, str]]:
+        """Return the stored (caption, kicker, image_filename) for the given edition_ids."""
+        with self.db_conn.cursor() as cur:
+            cur.execute(SELECT_EDITIONS_SQL, (edition_ids,))
+            rows = cur.fetchall()
+        # End the read-only transaction so the connection is not left idle in
+        # transaction while the downloads run
+        self.db_conn.rollback()
+        return {edition_id: (caption, kicker, image_filename)
+                for edition_id, caption, kicker, image_filename in rows}
+
+    def _upsert_editions(self, editions: list[EditionRow]):
+        """Upsert copertina editions into PostgreSQL, one transaction per batch.
+
+        A failed batch is rolled back and logged, and the remaining batches are
+        still written, so one bad row does not discard a whole backfill.
         """
-        date_only = edition_date.date() if hasattr(edition_date, 'date') else edition_date
-        try:
-            with self.db_conn.cursor() as cur:
-                cur.execute(sql, (edition_id, date_only, caption, kicker, image_filename))
-            self.db_conn.commit()
-            self.logger.info(f"Upserted edition {edition_id} into PostgreSQL")
-        except Exception:
-            self.db_conn.rollback()
-            self.logger.exception(f"Failed to upsert edition {edition_id}")
-            raise
+        for start in range(0, len(editions), UPSERT_BATCH_SIZE):
+            batch = editions[start:start + UPSERT_BATCH_SIZE]
+            try:
+                with self.db_conn.cursor() as cur:
+                    # One page per batch, so each batch is a single round-trip
+                    psycopg2.extras.execute_batch(cur, UPSERT_SQL, batch, page_size=UPSERT_BATCH_SIZE)
+                self.db_conn.commit()
+                self.logger.info(f"Upserted {len(batch)} editions into PostgreSQL")
+            except Exception:
+                self.db_conn.rollback()
+                self.logger.exception(f"Batch upsert failed ({len(batch)} editions rolled back)")
 
     def _init_directus(self):
-        """Initialize Directus configuration."""
+        """Initialize Directus configuration and the pooled HTTP session."""
         self.directus_token = self._get_required_env("DIRECTUS_API_TOKEN")
         self.directus_headers = {
             'Content-Type': 'application/json',
@@ -131,10 +230,38 @@ class DirectusManifestoScraper:
         self.directus_url = "https://directus.ilmanifesto.it/items/articles"
         self.assets_url = "https://directus.ilmanifesto.it/assets"
 
+        # Keep-alive session shared by every Directus call (article list, image
+        # records, asset downloads): requests negotiates gzip by default, and
+        # the pooled adapter reuses the TLS connection to directus.ilmanifesto.it
+        self.session = requests.Session()
+        self.session.headers.update(self.directus_headers)
+        # One pooled connection per worker thread, so concurrent downloads
+        # never open throwaway connections outside the pool; failed connections
+        # and 502/503/504 responses are retried instead of failing the date
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=MAX_WORKERS, max_retries=HTTP_RETRY,
+        ))
+
     def _setup_images_dir(self):
         """Setup images directory."""
         self.images_dir = Path(__file__).parent.parent.parent / "images"
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.image_index: dict[str, str] = {}
+
+    def _index_images(self):
+        """Map each image stem in the images directory to its full filename.
+
+        Built once per run, so checking for an already downloaded image is a
+        dict lookup instead of a directory glob per edition. Downloads only
+        take their final name once complete (see _download_image); empty files
+        are still skipped as a backstop, so they are fetched again.
+        """
+        with os.scandir(self.images_dir) as entries:
+            self.image_index = {
+                Path(entry.name).stem: entry.name
+                for entry in entries
+                if entry.is_file() and entry.stat().st_size > 0
+            }
 
     def parse_dates_from_args(self) -> list[datetime]:
         """Parse command line arguments and return list of dates to process."""
@@ -157,8 +284,14 @@ class DirectusManifestoScraper:
             type=str,
             help='File containing a list of dates to fetch, one per line in YYYY-MM-DD format'
         )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Fetch and download editions again even if they are already stored'
+        )
 
         args = parser.parse_args()
+        self.force_download = args.force
 
         if args.number:
             return self._generate_date_range(args.number)
@@ -170,17 +303,18 @@ class DirectusManifestoScraper:
 
     def _generate_date_range(self, number_of_days: int) -> list[datetime]:
         """Generate a list of dates for the last N days."""
-        today = datetime.now(tz=timezone.utc)
-        dates = []
-        for i in range(number_of_days):
-            date = today - timedelta(days=i)
-            dates.append(date)
-        return dates
+        # Midnight UTC, like the dates parsed from --date and --datefile
+        today = datetime.now(tz=timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return [today - timedelta(days=i) for i in range(number_of_days)]
 
     def _parse_single_date(self, date_str: str) -> datetime:
         """Parse a single date string."""
+        # fromisoformat also takes the basic and week forms (20250301, 2025-W10-1),
+        # so only the extended YYYY-MM-DD shape is let through to it
+        if len(date_str) != len("YYYY-MM-DD") or date_str[4] != "-" or date_str[7] != "-":
+            raise InvalidDateFormatError(date_str)
         try:
-            return datetime.strptime(f"{date_str} +0000", "%Y-%m-%d %z")
+            return datetime.combine(date.fromisoformat(date_str), datetime.min.time(), tzinfo=timezone.utc)
         except ValueError as e:
             raise InvalidDateFormatError(date_str) from e
 
@@ -191,82 +325,166 @@ class DirectusManifestoScraper:
             raise DateFileNotFoundError(date_file_path)
 
         dates = []
-        with date_file.open('r') as f:
-            for line_num, line in enumerate(f, 1):
-                date_str = line.strip()
-                if not date_str:
-                    continue
-                try:
-                    dates.append(self._parse_single_date(date_str))
-                except InvalidDateFormatError as e:
-                    self.logger.warning(f"Line {line_num}: {e}")
-                    continue
+        for line_num, line in enumerate(date_file.read_text().splitlines(), 1):
+            date_str = line.strip()
+            if not date_str:
+                continue
+            try:
+                dates.append(self._parse_single_date(date_str))
+            except InvalidDateFormatError as e:
+                self.logger.warning(f"Line {line_num}: {e}")
+                continue
         return dates
 
     def process_copertine(self, dates: list[datetime]):
-        """Process copertina articles for multiple dates."""
+        """Process copertina articles for multiple dates.
+
+        The articles come from one Directus request per span of dates, image
+        downloads run concurrently on a thread pool, and the results are then
+        written to PostgreSQL in batches from this thread, which owns the
+        connection.
+        """
         self.logger.info(f"Processing {len(dates)} dates")
 
-        for date in dates:
-            date_str = date.strftime("%Y-%m-%d")
-            self.logger.info(f"Processing copertina for date: {date_str}")
+        pending = self._dedupe_dates(dates)
+        if not pending:
+            return
 
-            try:
-                article = self._fetch_copertina_for_date(date)
-                if article:
-                    self._process_copertina(article, date)
-                else:
-                    self.logger.error(f"No copertina found for date: {date_str}")
-            except Exception:
-                self.logger.exception(f"Failed to process copertina for {date_str}")
+        self._index_images()
+
+        # One query up front, by the unique edition_id, instead of comparing
+        # against the table per edition
+        existing = self._fetch_existing_editions(list(pending))
+
+        self._skip_stored(pending, existing)
+        if not pending:
+            return
+
+        editions: list[EditionRow] = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            # One Directus request per span of dates; only downloads run per date
+            articles: dict[str, dict[str, Any]] = {}
+            for found in pool.map(self._fetch_copertine, self._date_spans(list(pending.values()))):
+                articles.update(found)
+
+            futures = {}
+            for edition_id, day in pending.items():
+                article = articles.get(day.strftime(DATE_FORMAT))
+                if not article:
+                    self.logger.error(f"No copertina found for date: {day.strftime(DATE_FORMAT)}")
+                    continue
+                futures[pool.submit(self._prepare_copertina, article, day)] = (edition_id, day)
+
+            for future in as_completed(futures):
+                edition_id, day = futures[future]
+                try:
+                    prepared = future.result()
+                    if prepared:
+                        article, image_filename = prepared
+                        row = (
+                            edition_id,
+                            day.date(),
+                            article.get("referenceHeadline", ""),
+                            article.get("articleKicker"),
+                            image_filename,
+                        )
+                        if existing.get(edition_id) == row[2:]:
+                            self.logger.info(f"Edition {edition_id} unchanged, skipping write")
+                        else:
+                            editions.append(row)
+                except Exception:
+                    self.logger.exception(f"Failed to process copertina for {day.strftime(DATE_FORMAT)}")
+
+        self._upsert_editions(editions)
+
+    def _dedupe_dates(self, dates: list[datetime]) -> dict[str, datetime]:
+        """Map edition_id to date, keeping the first date for each edition."""
+        # edition_id is unique in the editions table, so it is also the dedup key
+        pending: dict[str, datetime] = {}
+        for day in dates:
+            edition_id = day.strftime(EDITION_ID_FORMAT)
+            if edition_id in pending:
+                self.logger.info(f"Skipping duplicate edition {edition_id}")
                 continue
+            pending[edition_id] = day
+        return pending
+
+    def _skip_stored(
+        self, pending: dict[str, datetime], existing: dict[str, tuple[str, str | None, str]]
+    ):
+        """Drop pending editions that are already stored with their image on disk.
 
-    def _fetch_copertina_for_date(self, date: datetime) -> dict[str, Any] | None:
-        """Fetch copertina article for a specific date from Directus."""
+        Those need no Directus round-trips at all on incremental runs.
+        """
+        if self.force_download:
+            return
+        on_disk = set(self.image_index.values())
+        stored_ids = [e for e in pending if e in existing and existing[e][2] in on_disk]
+        for edition_id in stored_ids:
+            self.logger.info(f"Edition {edition_id} already stored, skipping")
+            del pending[edition_id]
+
+    def _date_spans(self, days: list[datetime]) -> list[tuple[datetime, datetime]]:
+        """Group dates into (first, last) spans that can each be fetched in one request.
+
+        Dates at most SPAN_MAX_GAP_DAYS apart share a span, so a -n run is a
+        single span while sparse datefiles do not pull years of articles.
+        """
+        ordered = sorted(days)
+        spans = [(ordered[0], ordered[0])]
+        for day in ordered[1:]:
+            first, last = spans[-1]
+            if (day.date() - last.date()).days > SPAN_MAX_GAP_DAYS:
+                spans.append((day, day))
+            else:
+                spans[-1] = (first, day)
+        return spans
+
+    def _fetch_copertine(self, span: tuple[datetime, datetime]) -> dict[str, dict[str, Any]]:
+        """Fetch the copertina articles for a span of dates from Directus.
+
+        Issues a single request covering the span and returns the latest
+        article per publication day, keyed by YYYY-MM-DD.
+        """
+        start, end = span
         params = {
-            'fields': 'id,articleEdition,referenceHeadline,articleTag,articleKicker,datePublished,author,headline,articleEditionPosition,articleFeaturedImageDescription,articleFeaturedImage',
-            'filter[syncSource][_eq]': 'wp',
-            'filter[articlePositionCover][_eq]': 1,
-            'filter[datePublished][_gte]': date.strftime('%Y-%m-%dT00:00:00'),
-            'filter[datePublished][_lte]': date.strftime('%Y-%m-%dT23:59:59'),
-            'sort': '-datePublished',
-            'limit': 1
+            **COPERTINA_BASE_PARAMS,
+            'filter[datePublished][_between]': f"{start.strftime(DAY_START_FORMAT)},{end.strftime(DAY_END_FORMAT)}",
         }
 
         try:
-            response = requests.get(self.directus_url, params=params, headers=self.directus_headers, timeout=30.0)
+            response = self.session.get(self.directus_url, params=params, timeout=30.0)
             response.raise_for_status()
+            articles = orjson.loads(response.content).get('data', [])
+        except (requests.RequestException, orjson.JSONDecodeError):
+            self.logger.exception(
+                f"Error fetching copertine from {start.strftime(DATE_FORMAT)} to {end.strftime(DATE_FORMAT)}"
+            )
+            return {}
 
-            articles = response.json().get('data', [])
-            if articles:
-                return articles[0]
+        # Results are sorted newest first, so the first article seen for a day wins
+        by_day: dict[str, dict[str, Any]] = {}
+        for article in articles:
+            by_day.setdefault((article.get('datePublished') or '')[:10], article)
+        return by_day
 
-        except requests.RequestException:
-            self.logger.exception(f"Error fetching copertina for {date.strftime('%Y-%m-%d')}")
+    def _prepare_copertina(self, article: dict[str, Any], date: datetime) -> tuple[dict[str, Any], str] | None:
+        """Validate a copertina article and download its image.
 
-        return None
+        Runs on a worker thread; returns the article and the saved image filename.
+        """
+        self.logger.info(f"Processing copertina for date: {date.strftime(DATE_FORMAT)}")
 
-    def _process_copertina(self, article: dict[str, Any], date: datetime):
-        """Process a single copertina article."""
         if not self._validate_article(article):
             self.logger.warning(f"Article validation failed for ID {article.get('id')}")
-            return
-
-        # Generate edition_id in DD-MM-YYYY format
-        edition_id = date.strftime("%d-%m-%Y")
+            return None
 
-        # Download image
         image_filename = self._download_and_save_image(article, date)
-        if image_filename:
-            self._upsert_edition(
-                edition_id=edition_id,
-                edition_date=date,
-                caption=article.get("referenceHeadline", ""),
-                kicker=article.get("articleKicker"),
-                image_filename=image_filename,
-            )
-        else:
+        if not image_filename:
             self.logger.error(f"Failed to download image for article {article.get('id')}")
+            return None
+
+        return article, image_filename
 
     def _validate_article(self, article: dict[str, Any]) -> bool:
         """Validate that an article has all required properties."""
@@ -288,53 +506,43 @@ class DirectusManifestoScraper:
 
     def _download_and_save_image(self, article: dict[str, Any], date: datetime) -> str | None:
         """Download and save the article's featured image."""
-        image_id = article.get('articleFeaturedImage')
-        if not image_id:
-            self.logger.error(f"No featured image ID for article {article.get('id')}")
+        featured_image = article.get('articleFeaturedImage')
+        if not featured_image:
+            self.logger.error(f"No featured image for article {article.get('id')}")
             return None
 
-        # Get the actual image URL from Directus
-        image_url = self._get_asset_url(image_id)
-        if not image_url:
-            return None
-
-        # Generate filename
+        # Generate filename first: it only depends on headline and date, so an
+        # image from a previous run can be reused without asking Directus
         filename = self._generate_image_filename(article, date)
         if not filename:
             return None
 
-        # Download the image
-        return self._download_image(image_url, filename)
-
-    def _get_asset_url(self, image_id: str) -> str | None:
-        """Get the asset URL for an image ID."""
-        try:
-            image_record_url = f"https://directus.ilmanifesto.it/items/images/{image_id}"
-
-            response = requests.get(image_record_url, headers=self.directus_headers, timeout=30.0)
-            response.raise_for_status()
-
-            image_record = response.json().get('data')
-            if image_record and "image" in image_record:
-                return f"{self.assets_url}/{image_record['image']}"
-            else:
-                self.logger.error(f"Malformed image record for image ID {image_id}")
-                return None
-
-        except requests.RequestException:
-            self.logger.exception(f"Error getting asset URL for image {image_id}")
+        if not self.force_download:
+            existing = self.image_index.get(filename)
+            if existing:
+                self.logger.info(f"Image already on disk: {existing}")
+                return existing
+
+        # The article query expands the relation, so the asset filename is
+        # already here and no image record lookup is needed
+        asset = featured_image.get('image') if isinstance(featured_image, dict) else None
+        if not asset:
+            self.logger.error(f"Featured image of article {article.get('id')} has no asset")
             return None
 
+        # Download the image
+        return self._download_image(f"{self.assets_url}/{asset}", filename)
+
     def _generate_image_filename(self, article: dict[str, Any], date: datetime) -> str | None:
         """Generate a descriptive filename for the image."""
         try:
             headline = article.get("referenceHeadline", "")
             if not headline:
                 self.logger.warning(f"No headline for article {article.get('id')}")
-                return f"il-manifesto_{date.strftime('%Y-%m-%d')}_no-headline"
+                return f"il-manifesto_{date.strftime(DATE_FORMAT)}_no-headline"
             else:
                 slug = self._slugify(headline)
-                date_str = date.strftime('%Y-%m-%d')
+                date_str = date.strftime(DATE_FORMAT)
                 return f"il-manifesto_{date_str}_{slug}"
 
         except Exception:
@@ -343,45 +551,53 @@ class DirectusManifestoScraper:
 
     def _slugify(self, text: str) -> str:
         """Convert string to a URL-friendly slug."""
-        text = text.lower()
-        text = re.sub(r'[\s\W]+', '-', text)
-        return text.strip('-')
+        return SLUG_SEPARATOR_RE.sub('-', text.lower()).strip('-')
 
     def _download_image(self, image_url: str, base_filename: str) -> str | None:
-        """Download image from URL and save to file."""
+        """Download image from URL and stream it to file."""
+        part_path: Path | None = None
         try:
             self.logger.info(f"Downloading image from: {image_url}")
-            response = requests.get(image_url, headers=self.directus_headers, timeout=30.0)
-            response.raise_for_status()
-
-            if response.status_code != HTTP_OK:
-                self.logger.warning(f"Failed to download image. Status code: {response.status_code}")
-                return None
-
-            # Determine file extension from content type
-            content_type = response.headers.get('content-type')
-            if not content_type:
-                self.logger.warning(f"No content-type header for image {image_url}")
-                extension = '.jpg'  # Fallback
-            else:
-                extension = mimetypes.guess_extension(content_type) or '.jpg'
-
-            # Create full filename with extension
-            filename_with_ext = f"{base_filename}{extension}"
-            file_path = self.images_dir / filename_with_ext
-
-            # Save the image
-            file_path.write_bytes(response.content)
-            self.logger.info(f"Image saved to {file_path}. Size: {len(response.content)} bytes")
+            with self.session.get(image_url, stream=True, timeout=30.0) as response:
+                response.raise_for_status()
+
+                # Determine file extension from content type
+                content_type = response.headers.get('content-type')
+                if not content_type:
+                    self.logger.warning(f"No content-type header for image {image_url}")
+                    extension = '.jpg'  # Fallback
+                else:
+                    extension = _guess_extension(content_type)
+
+                # Create full filename with extension
+                filename_with_ext = f"{base_filename}{extension}"
+                file_path = self.images_dir / filename_with_ext
+
+                # Stream the body to a temporary name instead of buffering the
+                # whole image; it only takes the final name once complete, so a
+                # failed download never leaves a truncated image to be reused
+                part_path = file_path.with_name(f"{file_path.name}.part")
+                bytes_written = 0
+                with part_path.open('wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        bytes_written += f.write(chunk)
+                os.replace(part_path, file_path)
+                self.logger.info(f"Image saved to {file_path}. Size: {bytes_written} bytes")
 
         except Exception:
             self.logger.exception(f"Error downloading image {image_url}")
+            if part_path:
+                part_path.unlink(missing_ok=True)
             return None
         else:
             return filename_with_ext
 
     def cleanup(self):
         """Clean up resources."""
+        if hasattr(self, '_log_buffer'):
+            self._log_buffer.flush()
+        if hasattr(self, 'session') and self.session:
+            self.session.close()
         if hasattr(self, 'db_conn') and self.db_conn:
             try:
                 self.db_conn.close()
@@ -1,12 +1,16 @@
-import json
+import asyncio
 import logging
-import time
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
 from pathlib import Path
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from aiolimiter import AsyncLimiter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 # Configure logging
 logging.basicConfig(
@@ -18,61 +22,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def _is_main_article(article: BeautifulSoup) -> bool:
-    """Check if an article is the main article."""
+EDITION_URL = "https://ilmanifesto.it/edizioni/il-manifesto/il-manifesto-del-{}"
+MAX_CONCURRENT_FETCHES = 5
+MAX_FETCHES_PER_SECOND = 5
+# Below this many dates, starting worker processes costs more than the parsing
+MIN_DATES_FOR_PROCESS_POOL = 4
+MAX_PARSE_PROCESSES = 4
+
+# CSS selectors for the parts of the main article on an edition page
+ARTICLE_SELECTOR = "article.PostCard"
+IMAGE_SELECTOR = "img[src*='static.ilmanifesto.it'], img[src*='/cdn-cgi/image']"
+CATEGORY_SELECTOR = "a.text-red-500"
+AUTHOR_SELECTOR = "span.font-serif.text-sm.italic"
+BODY_SELECTOR = "p.body-ns-1"
+OVERLINE_SELECTOR = "span.overline-3"
+IMAGE_CONTAINER_SELECTOR = "div.w-full.overflow-hidden.order-1"
+TITLE_SELECTOR = "h3"
+
+def _match_main_article(article: LexborNode) -> tuple[LexborNode, LexborNode, LexborNode] | None:
+    """Return the (image, category, title) nodes if an article is the main article.
+
+    The nodes found while checking are handed on to the extraction, so no
+    selector runs twice.
+    """
     # Check if it has a large image container
-    img_container = article.select_one("div.w-full.overflow-hidden.order-1")
+    img_container = article.css_first(IMAGE_CONTAINER_SELECTOR)
     if not img_container:
-        return False
+        return None
 
     # Check if it has an image
-    img_tag = img_container.select_one("img[src*='static.ilmanifesto.it'], img[src*='/cdn-cgi/image']")
+    img_tag = img_container.css_first(IMAGE_SELECTOR)
     if not img_tag:
-        return False
+        return None
 
     # Check if it has a category
-    category_link = article.select_one("a.text-red-500")
+    category_link = article.css_first(CATEGORY_SELECTOR)
     if not category_link:
-        return False
+        return None
 
     # Check if it has a title
-    title_tag = article.find("h3")
+    title_tag = article.css_first(TITLE_SELECTOR)
     if not title_tag:
-        return False
+        return None
 
-    return True
+    return img_tag, category_link, title_tag
 
-def _extract_article_details(article: BeautifulSoup) -> dict:
+def _extract_article_details(
+    article: LexborNode, img_tag: LexborNode, category_link: LexborNode, title_tag: LexborNode,
+) -> dict:
     """Extract details from the main article."""
-    # Get the category
-    category_link = article.select_one("a.text-red-500")
-    category = category_link.get_text().strip() if category_link else None
-
-    # Get the image URL
-    img_tag = article.select_one("img[src*='static.ilmanifesto.it'], img[src*='/cdn-cgi/image']")
-    image_url = img_tag.get("src") if img_tag else None
-
-    # Get the title
-    title = None
-    title_tag = article.find("h3")
-    if title_tag:
-        title = title_tag.get_text().strip()
+    # Category, image and title were already located by _match_main_article
+    category = category_link.text().strip()
+    image_url = img_tag.attributes.get("src")
+    title = title_tag.text().strip()
 
     # Get the author
     author = None
-    author_tag = article.select_one("span.font-serif.text-sm.italic")
+    author_tag = article.css_first(AUTHOR_SELECTOR)
     if author_tag:
-        author = author_tag.get_text().strip()
+        author = author_tag.text().strip()
 
     # Get the body text
     body = None
-    body_tag = article.select_one("p.body-ns-1")
+    body_tag = article.css_first(BODY_SELECTOR)
     if body_tag:
         # Get the text but exclude any overline text
-        overline = body_tag.select_one("span.overline-3")
+        overline = body_tag.css_first(OVERLINE_SELECTOR)
         if overline:
             overline.decompose()
-        body = body_tag.get_text().strip()
+        body = body_tag.text().strip()
 
     return {
         "category": category,
@@ -84,76 +102,105 @@ def _extract_article_details(article: BeautifulSoup) -> dict:
 
 def extract_page_info(html_content: str) -> dict:
     """Extract information from the page HTML"""
-    soup = BeautifulSoup(html_content, "html.parser")
+    tree = LexborHTMLParser(html_content)
 
     # Find all articles
-    articles = soup.find_all("article", class_="PostCard")
+    articles = tree.css(ARTICLE_SELECTOR)
     if not articles:
         logger.warning("No articles found")
         return {}
 
     # Look for the main article
-    main_article = None
     for article in articles:
-        if _is_main_article(article):
-            main_article = article
-            break
-
-    if not main_article:
-        logger.warning("No main article found")
-        return {}
-
-    return _extract_article_details(main_article)
-
-def check_past_dates(num_days: int = 10):
+        nodes = _match_main_article(article)
+        if nodes:
+            return _extract_article_details(article, *nodes)
+
+    logger.warning("No main article found")
+    return {}
+
+def _log_page_info(date_str: str, page_info: dict) -> None:
+    """Log the article found for a date."""
+    logger.info("\nChecking date: %s", date_str)
+    logger.info("Found article:")
+    logger.info("Category: %s", page_info.get("category"))
+    logger.info("Title: %s", page_info.get("title"))
+    logger.info("Author: %s", page_info.get("author"))
+    logger.info("Image: %s", page_info.get("image_url"))
+    logger.info("Body: %s", page_info.get("body")[:100] + "..." if page_info.get("body") else None)
+
+async def _fetch_page_info(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    limiter: AsyncLimiter,
+    executor: Executor | None,
+    date_str: str,
+) -> dict | None:
+    """Fetch one edition page and extract its main article.
+
+    Parsing runs on executor, or on the loop's default thread pool if None.
+    """
+    url = EDITION_URL.format(date_str)
+    try:
+        async with semaphore, limiter:
+            logger.info("URL: %s", url)
+            response = await client.get(url)
+        if response.status_code != HTTPStatus.OK:
+            logger.warning("Failed to fetch page for date %s. Status code: %d", date_str, response.status_code)
+            return None
+        # Parse off the event loop so other fetches keep going
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, extract_page_info, response.text)
+    except Exception:
+        logger.exception("Error processing date %s", date_str)
+        return None
+
+async def check_past_dates(num_days: int = 10):
     """Check articles from the past num_days"""
-    base_url = "https://ilmanifesto.it/edizioni/il-manifesto/il-manifesto-del-{}"
     results = {}
 
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     }
 
-    with httpx.Client(timeout=30.0, follow_redirects=True, headers=headers) as client:
-        # Start from today and go back num_days
-        current_date = datetime.now(tz=timezone.utc)
-        for i in range(num_days):
-            date_str = current_date.strftime("%d-%m-%Y")
-            url = base_url.format(date_str)
-
-            logger.info("\nChecking date: %s", date_str)
-            logger.info("URL: %s", url)
-
-            try:
-                response = client.get(url)
-                if response.status_code == HTTPStatus.OK:
-                    page_info = extract_page_info(response.text)
-                    if page_info:
-                        results[date_str] = page_info
-                        logger.info("Found article:")
-                        logger.info("Category: %s", page_info.get("category"))
-                        logger.info("Title: %s", page_info.get("title"))
-                        logger.info("Author: %s", page_info.get("author"))
-                        logger.info("Image: %s", page_info.get("image_url"))
-                        logger.info("Body: %s", page_info.get("body")[:100] + "..." if page_info.get("body") else None)
-                    else:
-                        logger.warning("No article found for date %s", date_str)
-                else:
-                    logger.warning("Failed to fetch page for date %s. Status code: %d", date_str, response.status_code)
-            except Exception:
-                logger.exception("Error processing date %s", date_str)
-
-            # Move to previous day
-            current_date -= timedelta(days=1)
-            # Small delay between requests
-            if i < num_days - 1:  # Don't sleep after the last request
-                time.sleep(1)
+    # Start from today and go back num_days
+    today = datetime.now(tz=timezone.utc)
+    date_strs = [(today - timedelta(days=i)).strftime("%d-%m-%Y") for i in range(num_days)]
+
+    # At most MAX_CONCURRENT_FETCHES requests in flight and MAX_FETCHES_PER_SECOND
+    # started each second, to stay polite; the token bucket still lets a burst through
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    limiter = AsyncLimiter(MAX_FETCHES_PER_SECOND, 1)
+    limits = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+    # With enough pages, parse them in worker processes so they use every
+    # core instead of sharing the GIL; a few pages parse faster on a thread
+    pool: AbstractContextManager[Executor | None]
+    if len(date_strs) >= MIN_DATES_FOR_PROCESS_POOL:
+        pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, MAX_PARSE_PROCESSES))
+    else:
+        pool = nullcontext()
+    with pool as executor:
+        # HTTP/2 multiplexes all the date fetches over one TLS connection; httpx
+        # already advertises the compressions it can decode in Accept-Encoding
+        async with httpx.AsyncClient(
+            http2=True, timeout=30.0, follow_redirects=True, headers=headers, limits=limits,
+        ) as client:
+            pages = await asyncio.gather(*(
+                _fetch_page_info(client, semaphore, limiter, executor, date_str)
+                for date_str in date_strs
+            ))
+
+    for date_str, page_info in zip(date_strs, pages, strict=True):
+        if page_info:
+            results[date_str] = page_info
+            _log_page_info(date_str, page_info)
+        else:
+            logger.warning("No article found for date %s", date_str)
 
     # Save results to JSON for inspection
     output_file = Path("test_results.json")
-    with output_file.open("w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     logger.info("\nResults saved to %s", output_file)
 
 if __name__ == "__main__":
-    check_past_dates(10)
+    asyncio.run(check_past_dates(10))
@@ -1,9 +1,10 @@
-import json
 import logging
 from datetime import datetime, timezone
+from pathlib import Path
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 # Configure logging
 logging.basicConfig(
@@ -15,53 +16,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def _find_main_article(articles: list) -> BeautifulSoup | None:
-    """Find the main article from a list of articles."""
+ARTICLE_SELECTOR = "article.PostCard"
+IMAGE_SELECTOR = "img[src*='static.ilmanifesto.it'], img[src*='/cdn-cgi/image']"
+CATEGORY_SELECTOR = "a.text-red-500"
+AUTHOR_SELECTOR = "span.font-serif.text-sm.italic"
+BODY_SELECTOR = "p.body-ns-1"
+OVERLINE_SELECTOR = "span.overline-3"
+TITLE_SELECTORS = ("h1", "h2", "h3")
+
+def _find_main_article(articles: list[LexborNode]) -> tuple[LexborNode, LexborNode] | None:
+    """Find the main article from a list of articles.
+
+    Returns the article together with the image node found while checking it.
+    """
     for article in articles:
         # Check if it has an image
-        img_tag = article.select_one("img[src*='static.ilmanifesto.it'], img[src*='/cdn-cgi/image']")
+        img_tag = article.css_first(IMAGE_SELECTOR)
         if not img_tag:
             continue
 
         # Check if it has a category
-        category_link = article.select_one("a.text-red-500")
-        if category_link and "ECONOMIA" in category_link.get_text().strip().upper():
-            logger.info("Found main article with category: %s", category_link.get_text().strip())
-            return article
+        category_link = article.css_first(CATEGORY_SELECTOR)
+        if category_link and "ECONOMIA" in category_link.text().strip().upper():
+            logger.info("Found main article with category: %s", category_link.text().strip())
+            return article, img_tag
     return None
 
-def _extract_article_details(article: BeautifulSoup) -> dict:
+def _extract_article_details(article: LexborNode, img_tag: LexborNode) -> dict:
     """Extract details from the main article."""
-    # Get the image URL
-    img_tag = article.select_one("img[src*='static.ilmanifesto.it'], img[src*='/cdn-cgi/image']")
-    image_url = img_tag.get("src") if img_tag else None
+    # The image was already located by _find_main_article
+    image_url = img_tag.attributes.get("src")
     logger.info("Found image URL: %s", image_url)
 
     # Get the title - try different heading levels
     title = None
-    for title_selector in ["h1", "h2", "h3"]:
-        title_tag = article.find(title_selector)
+    for title_selector in TITLE_SELECTORS:
+        title_tag = article.css_first(title_selector)
         if title_tag:
-            title = title_tag.get_text().strip()
+            title = title_tag.text().strip()
             logger.info("Found title with selector %s: %s", title_selector, title)
             break
 
     # Get the author and body text
     author = None
-    author_tag = article.select_one("span.font-serif.text-sm.italic")
+    author_tag = article.css_first(AUTHOR_SELECTOR)
     if author_tag:
-        author = author_tag.get_text().strip()
+        author = author_tag.text().strip()
         logger.info("Found author: %s", author)
 
     # Look for body text
     body = None
-    body_tag = article.select_one("p.body-ns-1")
+    body_tag = article.css_first(BODY_SELECTOR)
     if body_tag:
         # Get the text but exclude any overline text
-        overline = body_tag.select_one("span.overline-3")
+        overline = body_tag.css_first(OVERLINE_SELECTOR)
         if overline:
             overline.decompose()
-        body = body_tag.get_text().strip()
+        body = body_tag.text().strip()
         logger.info("Found body text")
 
     return {
@@ -73,26 +84,28 @@ def _extract_article_details(article: BeautifulSoup) -> dict:
 
 def extract_page_info(html_content: str):
     """Extract information from the page HTML"""
-    soup = BeautifulSoup(html_content, "html.parser")
-    logger.info("Page title: %s", soup.title.string if soup.title else "No title found")
+    tree = LexborHTMLParser(html_content)
+    title_tag = tree.css_first("title")
+    logger.info("Page title: %s", title_tag.text() if title_tag else "No title found")
 
     # Find all articles
-    articles = soup.find_all("article", class_="PostCard")
+    articles = tree.css(ARTICLE_SELECTOR)
     if not articles:
         logger.warning("No articles found")
         return {}
 
     # Look for the main article
-    main_article = _find_main_article(articles)
+    found = _find_main_article(articles)
 
-    if not main_article:
+    if not found:
         logger.warning("No main article found")
-        # Log all articles for debugging
-        for i, article in enumerate(articles, 1):
-            logger.info("Article %d HTML:\n%s", i, article.prettify())
+        # Dump all articles only in debug runs; serializing them is not free
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, article in enumerate(articles, 1):
+                logger.debug("Article %d HTML:\n%s", i, article.html)
         return {}
 
-    return _extract_article_details(main_article)
+    return _extract_article_details(*found)
 
 if __name__ == "__main__":
     # Test with today's edition
@@ -117,8 +130,7 @@ if __name__ == "__main__":
                     logger.info("Body: %s", page_info.get("body"))
 
                     # Save to JSON for inspection
-                    with open("test_output.json", "w", encoding="utf-8") as f:
-                        json.dump(page_info, f, ensure_ascii=False, indent=2)
+                    Path("test_output.json").write_bytes(orjson.dumps(page_info, option=orjson.OPT_INDENT_2))
             else:
                 logger.error("Failed to fetch page. Status code: %d", response.status_code)
     except Exception: